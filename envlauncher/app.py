@@ -17,25 +17,24 @@
 
 """Application logic for EnvLauncher."""
 
-import collections
-import configparser
+import functools
 import io
 import itertools
 import os
 import re
-import shlex
-import shutil
-import subprocess
-import tempfile
-from typing import List, Tuple, Optional
+import stat
+from collections.abc import MutableMapping
+from typing import List, Optional, Set, Tuple
 
-from . import cli
-from . import launchers
+# Heavier modules (shlex, tempfile, the launchers submodule, etc.)
+# are imported where they are used to keep start-up time low.
 
 
 APP_NAME = 'com.github.shawnbrown.EnvLauncher'
 __version__ = '0.1a1.dev1'
 
+_DEFAULT_PATHS = None  # Data paths computed from os.environ (set lazily).
+
 
 class DataPaths(object):
     """Class to fetch data paths that conform to the "XDG Base
@@ -46,12 +45,29 @@ class DataPaths(object):
         http://standards.freedesktop.org/basedir-spec/
     """
     def __init__(self, environ=None):
-        environ = dict(os.environ if environ is None else environ)
-
-        self._data_home = (environ.get('XDG_DATA_HOME')
-                           or os.path.join(environ.get('HOME'), '.local', 'share'))
-        self._data_dirs = (environ.get('XDG_DATA_DIRS')
-                           or '/usr/local/share:/usr/share').split(':')
+        global _DEFAULT_PATHS
+        env = os.environ if environ is None else environ
+        env_values = (env.get('XDG_DATA_HOME'),
+                      env.get('HOME'),
+                      env.get('XDG_DATA_DIRS'))
+
+        if (environ is None
+                and _DEFAULT_PATHS is not None
+                and _DEFAULT_PATHS[0] == env_values):
+            _, data_home, data_dirs = _DEFAULT_PATHS
+        else:
+            xdg_data_home, home, xdg_data_dirs = env_values
+            data_home = xdg_data_home or os.path.join(home, '.local', 'share')
+            data_dirs = tuple((xdg_data_dirs or '/usr/local/share:/usr/share').split(':'))
+            if environ is None:
+                # Remember paths derived from the process environment
+                # (reused only while the relevant variables are unchanged).
+                _DEFAULT_PATHS = (env_values, data_home, data_dirs)
+
+        self._data_home = data_home
+        self._data_dirs = list(data_dirs)
+        self._resource_cache = {}
+        self._listdir_cache = {}
 
     @property
     def data_home(self) -> str:
@@ -67,15 +83,44 @@ class DataPaths(object):
         """Return file path for the first matching data resource
         found in XDG data locations. If no file is found, raises
         a FileNotFoundError.
+
+        Each candidate directory is read once with os.scandir() and
+        checked with a set lookup rather than stat-ing every path.
+        Found paths and directory listings are cached for the life
+        of the instance (see invalidate()).
         """
-        search_dirs = [self.data_home] + self.data_dirs
+        cached = self._resource_cache.get((subdir, filename))
+        if cached is not None:
+            return cached  # <- EXIT!
+
+        for data_dir in [self._data_home] + self._data_dirs:
+            directory = os.path.join(data_dir, subdir)
+            if filename in self._list_directory(directory):
+                path = os.path.realpath(os.path.join(directory, filename))
+                self._resource_cache[(subdir, filename)] = path
+                return path  # <- EXIT!
         resource = os.path.join(subdir, filename)
-        for data_dir in search_dirs:
-            path = os.path.join(data_dir, resource)
-            if os.path.exists(path):
-                return os.path.realpath(path)  # <- EXIT!
         raise FileNotFoundError(f'Could not find resource {resource!r}')
 
+    def _list_directory(self, directory) -> Set[str]:
+        """Return the set of entry names in *directory* (empty if the
+        directory is missing or unreadable). Listings are cached.
+        """
+        names = self._listdir_cache.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:  # <- Missing, not a directory, or unreadable.
+                names = set()
+            self._listdir_cache[directory] = names
+        return names
+
+    def invalidate(self) -> None:
+        """Clear cached results of find_resource_path()."""
+        self._resource_cache.clear()
+        self._listdir_cache.clear()
+
     def make_home_path(self, subdir, filename) -> str:
         """Return data home path for given resource."""
         path = os.path.join(self._data_home, subdir, filename)
@@ -84,22 +129,51 @@ class DataPaths(object):
 
 def is_available(command) -> bool:
     """Return True if *command* is available."""
+    import shutil
     return shutil.which(command) is not None
 
 
+def find_available_commands(commands, path=None) -> Set[str]:
+    """Return the subset of *commands* that are available as
+    executable files in the directories of *path* (defaults to the
+    PATH environment variable).
+
+    Each directory is read once with os.scandir() rather than
+    probing every command/directory combination.
+    """
+    if path is None:
+        path = os.environ.get('PATH', os.defpath)
+    wanted = set(commands)
+    found = set()
+    for directory in path.split(os.pathsep):
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for entry in entries:
+                    if (entry.name in wanted
+                            and entry.name not in found
+                            and entry.is_file()
+                            and os.access(entry.path, os.X_OK)):
+                        found.add(entry.name)
+        except OSError:  # <- Missing, not a directory, or unreadable.
+            continue
+    return found
+
+
 def is_launcher_class(obj) -> bool:
     """Return True if *obj* is a concrete launcher class."""
+    from . import launchers
     return (isinstance(obj, type)
             and issubclass(obj, launchers.BaseLauncher)
             and (obj is not launchers.BaseLauncher))
 
 
-def get_available_launchers() -> List[launchers.BaseLauncher]:
-    """Return a list of available launcher classes."""
-    available = []
-    for obj in launchers.__dict__.values():
-        if is_launcher_class(obj) and is_available(obj.command):
-            available.append(obj)
+@functools.lru_cache(maxsize=1)
+def _find_available_launchers() -> Tuple['launchers.BaseLauncher', ...]:
+    """Scan PATH for launcher commands (scanned once and reused)."""
+    from . import launchers
+    launcher_classes = [x for x in launchers.__dict__.values() if is_launcher_class(x)]
+    commands = find_available_commands(x.command for x in launcher_classes)
+    available = tuple(x for x in launcher_classes if x.command in commands)
 
     if not available:
         import warnings
@@ -107,6 +181,180 @@ def get_available_launchers() -> List[launchers.BaseLauncher]:
     return available
 
 
+def get_available_launchers() -> List['launchers.BaseLauncher']:
+    """Return a list of available launcher classes (the PATH is
+    only scanned on the first call).
+    """
+    return list(_find_available_launchers())
+
+
+def split_command_line(value) -> List[str]:
+    """Split a command line string into a list of arguments using
+    shell-like syntax (like shlex.split()).
+
+    Values without quotes, backslashes, or non-space whitespace
+    (the usual case for Exec keys written by set_actions()) are
+    split on spaces directly rather than with the shlex lexer.
+    """
+    if any(char in value for char in '\'"\\\t\r\n'):
+        import shlex
+        return shlex.split(value)
+    return [x for x in value.split(' ') if x]
+
+
+class DesktopEntryGroup(MutableMapping):
+    """The key-value pairs of a single desktop entry group. Comment
+    and blank lines are kept in their original positions.
+    """
+    def __init__(self):
+        self._lines = []    # Holds [key, value] lists and comment strings.
+        self._entries = {}  # Maps keys to their [key, value] lists.
+
+    def __getitem__(self, key):
+        return self._entries[key][1]
+
+    def __setitem__(self, key, value):
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = [key, value]
+            self._entries[key] = entry
+            self._lines.append(entry)
+        else:
+            entry[1] = value
+
+    def __delitem__(self, key):
+        entry = self._entries.pop(key)
+        self._lines.remove(entry)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _iter_lines(self):
+        for entry in self._lines:
+            if isinstance(entry, str):
+                yield entry  # <- Comment or blank line.
+            elif entry[1] is None:
+                yield entry[0]
+            else:
+                yield f'{entry[0]}={entry[1]}'
+
+
+class DesktopEntryParser(object):
+    """A minimal parser for desktop entry files.
+
+    Unlike ConfigParser, comment and blank lines are preserved across
+    reads and writes, keys are case-sensitive, and values are never
+    interpolated (so field codes like "%U" are left as-is).
+    """
+    _header_regex = re.compile(r'\[(?P<header>.+)\]')
+
+    def __init__(self):
+        self._preamble = []  # Comment lines before the first group.
+        self._groups = {}
+
+    def read_file(self, f):
+        """Parse desktop entry groups from *f*, a file object or other
+        iterable of lines.
+        """
+        preamble = self._preamble
+        groups = self._groups
+        match_header = self._header_regex.fullmatch
+        group = None
+        pending_blanks = []
+        for lineno, line in enumerate(f, 1):
+            line = line.rstrip('\r\n')
+            stripped = line.strip()
+            if not stripped:
+                pending_blanks.append('')
+                continue  # <- Keep blank lines only if followed by content.
+
+            first_char = stripped[0]
+            matched = first_char == '[' and match_header(stripped)
+            if matched:
+                # The last blank line before a header is not kept (a
+                # blank line is always written between groups).
+                lines = preamble if group is None else group._lines
+                lines.extend(pending_blanks[1:])
+                name = matched.group('header')
+                group = groups.get(name)
+                if group is None:
+                    group = groups[name] = DesktopEntryGroup()
+                pending_blanks = []
+                continue
+
+            if first_char == '#':
+                lines = preamble if group is None else group._lines
+                lines.extend(pending_blanks)
+                lines.append(line)
+            elif group is None:
+                msg = f'line {lineno}: expected a group header, got {line!r}'
+                raise ValueError(msg)
+            else:
+                group._lines.extend(pending_blanks)
+                key, sep, value = line.partition('=')
+                group[key.strip()] = value.strip() if sep else None
+            pending_blanks = []
+
+    def read_string(self, string):
+        """Parse desktop entry groups from *string*."""
+        self.read_file(string.split('\n'))
+
+    def _iter_lines(self):
+        """Yield output lines (without line endings) for all groups."""
+        if self._preamble:
+            yield from self._preamble
+            yield ''
+        for name, group in self._groups.items():
+            yield f'[{name}]'
+            yield from group._iter_lines()
+            yield ''
+
+    def write(self, fileobject):
+        """Write desktop entry groups to *fileobject*."""
+        fileobject.writelines(f'{line}\n' for line in self._iter_lines())
+
+    def sections(self) -> List[str]:
+        """Return a list of group names."""
+        return list(self._groups)
+
+    def has_section(self, section) -> bool:
+        return section in self._groups
+
+    def remove_section(self, section) -> bool:
+        """Remove the given group. Returns True if it existed."""
+        return self._groups.pop(section, None) is not None
+
+    def get(self, section, option, *, fallback=None):
+        """Return value of *option* in *section* or *fallback* if the
+        group or key does not exist.
+        """
+        group = self._groups.get(section)
+        if group is None:
+            return fallback
+        return group.get(option, fallback)
+
+    def __contains__(self, section):
+        return section in self._groups
+
+    def __getitem__(self, section) -> DesktopEntryGroup:
+        return self._groups[section]
+
+    def __setitem__(self, section, values):
+        """Replace the contents of *section* with the given mapping of
+        *values* (the group is added if it does not already exist).
+        """
+        group = DesktopEntryGroup()
+        for key, value in values.items():
+            group[key] = value
+        self._groups[section] = group
+
+    def __delitem__(self, section):
+        del self._groups[section]
+
+
 class Settings(object):
     """Class to manage settings for EnvLauncher application.
 
@@ -118,82 +366,66 @@ class Settings(object):
 
         https://specifications.freedesktop.org/desktop-entry-spec/
     """
-    _escape_prefix = '_COMMENT'
-    _escape_suffix = 'ZZ=ZZ'
-    _escape_regex = re.compile(f'{_escape_prefix}\\d+{_escape_suffix}')
     _venv_prefix = 'venv'
 
     def __init__(self, file_or_path):
-        """Read desktop entry file and load it into a ConfigParser."""
+        """Read desktop entry file and load it into a DesktopEntryParser."""
         if isinstance(file_or_path, str):
             f = open(file_or_path)  # If not already open, open file locally.
         else:
             f = file_or_path
 
+        max_size = 128 * 1024  # If a desktop entry file is anywhere near
+                               # 128 kB, then something unexpected is going on.
+        self._parser = DesktopEntryParser()
         try:
-            string = f.read(128 * 1024)  # Read 128 kB from file.
-            if f.read(1):
-                raise RuntimeError('Desktop entry file exceeds 128 kB.')
-                # If a desktop entry file is anywhere near 128 kB,
-                # then something unexpected is going on.
+            try:
+                st = os.fstat(f.fileno())
+            except (AttributeError, OSError):  # <- No file descriptor (StringIO, etc.).
+                size = self._remaining_size(f)
+            else:
+                # Only regular files report a meaningful st_size (it's 0
+                # for pipes, FIFOs, character devices, and /proc files).
+                size = st.st_size if stat.S_ISREG(st.st_mode) else None
+
+            if size is None:  # <- Unknown size, read up to limit and check for more.
+                string = f.read(max_size)
+                if f.read(1):
+                    raise RuntimeError('Desktop entry file exceeds 128 kB.')
+                self._parser.read_string(string)
+            else:
+                if size > max_size:
+                    raise RuntimeError('Desktop entry file exceeds 128 kB.')
+                self._parser.read_file(f)  # <- Size is known, parse line-by-line.
         finally:
             if f != file_or_path:  # If opened locally, then close it.
                 f.close()
 
-        self._parser = configparser.ConfigParser(
-            dict_type=collections.OrderedDict,
-            delimiters=('=',),
-            allow_no_value=True,
-            comment_prefixes=None,
-        )
-        self._parser.optionxform = str  # Use option names as-is (no case-folding).
-        string = self._escape_comments(string)
-        self._parser.read_string(string)
         self._venv_number = itertools.count(1)
+        actions_value = self._parser.get('Desktop Entry', 'Actions', fallback='')
+        self._venv_identifiers = set(
+            x for x in actions_value.split(';') if x.startswith(self._venv_prefix)
+        )
         self._app_data_subdir = 'envlauncher'
 
     @staticmethod
-    def _lookahead(iterable, sentinal=None):
-        """s -> (s0,s1), (s1,s2), ..., (sN,sentinal)
-
-        Adapted from "pairwise()" recipe in itertools docs.
+    def _remaining_size(f) -> Optional[int]:
+        """Return the size of the unread portion of a seekable file
+        object or None if the file is not seekable.
         """
-        a, b = itertools.tee(iterable)
-        next(b, None)
-        return itertools.zip_longest(a, b, fillvalue=sentinal)
-
-    @classmethod
-    def _escape_comments(cls, string) -> str:
-        """Escape comment lines so that ConfigParser will retain them."""
-        escaped = []
-        for index, pair in enumerate(cls._lookahead(string.split('\n')), 1):
-            line, nextline = pair
-            if (line.startswith('#')                         # <- comment
-                    or (line == ''                           # <- blank line
-                        and nextline is not None             # <- next not last
-                        and not nextline.startswith('['))):  # <- next not section
-                line = f'{cls._escape_prefix}{index}{cls._escape_suffix}{line}'
-            escaped.append(line)
-        return '\n'.join(escaped)
-
-    @classmethod
-    def _unescape_comments(cls, string) -> str:
-        """Unescape lines to recover original comments."""
-        escaped = []
-        for line in string.split('\n'):
-            if cls._escape_regex.match(line):
-                _, _, line = line.partition(cls._escape_suffix)
-            escaped.append(line)
-        return '\n'.join(escaped)
+        if not getattr(f, 'seekable', lambda: False)():
+            return None
+        start = f.tell()
+        end = f.seek(0, io.SEEK_END)
+        f.seek(start)
+        return end - start
 
     @classmethod
     def from_string(cls, string):
         return cls(io.StringIO(string))
 
     def export_string(self) -> str:
-        f = io.StringIO()
-        self._parser.write(f, space_around_delimiters=False)
-        string = self._unescape_comments(f.getvalue())
+        string = '\n'.join(self._parser._iter_lines())
         return f'{string.strip()}\n'
 
     @property
@@ -210,18 +442,19 @@ class Settings(object):
     @property
     def launcher_class(self):
         """Launcher class to use when activating the environment."""
+        from . import launchers
         value = self._parser.get(section='X-EnvLauncher Options',
                                  option='TerminalEmulator', fallback='')
         class_name = launchers.get_class_name(value)
         launcher_class = getattr(launchers, class_name, None)
-        if is_launcher_class(launcher_class) and is_available(value):
+        available = _find_available_launchers()
+        if launcher_class in available:
             return launcher_class  # <- EXIT!
 
         # If the designated terminal emulator is not available, use
         # a different one.
-        launcher_classes = get_available_launchers()
-        if launcher_classes:
-            fallback = launcher_classes[0]
+        if available:
+            fallback = available[0]
             return fallback
         return None
 
@@ -263,25 +496,35 @@ class Settings(object):
 
     def make_identifier(self) -> str:
         """Generate and return a new action identifier."""
-        actions_value = self._parser['Desktop Entry']['Actions']
-        identifiers = {x for x in actions_value.split(';') if x.startswith(self._venv_prefix)}
-
+        identifiers = self._venv_identifiers
         candidate = f'{self._venv_prefix}{next(self._venv_number)}'
         while candidate in identifiers:
             candidate = f'{self._venv_prefix}{next(self._venv_number)}'
+        identifiers.add(candidate)
         return candidate
 
     def get_actions(self) -> List[Tuple[str, str, str, str]]:
         """Return ordered list of virtual environment launcher actions."""
-        # Build a dictionary of records from Desktop Action sections.
-        action_data = {}
-        for section in self._parser.sections():
-            if not section.startswith(f'Desktop Action {self._venv_prefix}'):
-                continue
-            _, _, identifier = section.partition('Desktop Action ')
-            name = self._parser[section]['Name']
-            exec_value = self._parser[section]['Exec']
-            exec_args = shlex.split(exec_value)
+        from . import cli
+
+        # Get the ordered list of venv identifiers from the Actions key.
+        actions_value = self._parser.get('Desktop Entry', 'Actions', fallback='')
+        identifiers = [x.strip() for x in actions_value.rstrip(';').split(';')]
+        identifiers = [x for x in identifiers if x.startswith(self._venv_prefix)]
+
+        # Build a list of Desktop Action records in identifier-order.
+        actions = []
+        seen = set()
+        for identifier in identifiers:
+            section = f'Desktop Action {identifier}'
+            if identifier in seen or section not in self._parser:
+                continue  # <- Skip duplicates and identifiers without groups.
+            seen.add(identifier)
+
+            group = self._parser[section]
+            name = group['Name']
+            exec_value = group['Exec']
+            exec_args = split_command_line(exec_value)
             exec_args = exec_args[1:]  # Slice-off 'envlauncher'
             try:
                 parsed_args = cli.parse_args(exec_args)
@@ -289,18 +532,7 @@ class Settings(object):
                 continue
             activate = parsed_args.activate
             directory = parsed_args.directory
-            action_data[identifier] = (identifier, name, activate, directory)
-
-        # Get the ordered list of identifiers from the Actions key.
-        actions_value = self._parser.get('Desktop Entry', 'Actions', fallback='')
-        identifiers = [x.strip() for x in actions_value.rstrip(';').split(';')]
-
-        # Build a list of Desktop Action records in identifier-order.
-        actions = []
-        for ident in identifiers:
-            action = action_data.pop(ident, None)
-            if action:
-                actions.append(action)
+            actions.append((identifier, name, activate, directory))
         return actions
 
     def set_actions(self, actions: List[Tuple[str, str, str, str]]):
@@ -309,10 +541,13 @@ class Settings(object):
         This replaces all of the existing launcher actions with the
         given list.
         """
+        import shlex
+
         # Remove existing venv action groups.
-        for section in self._parser.sections():
-            if section.startswith(f'Desktop Action {self._venv_prefix}'):
-                del self._parser[section]
+        section_prefix = f'Desktop Action {self._venv_prefix}'
+        stale = [x for x in self._parser.sections() if x.startswith(section_prefix)]
+        for section in stale:
+            self._parser.remove_section(section)
 
         # Add venv action groups and collect identifiers.
         venv_identifiers = []
@@ -324,12 +559,15 @@ class Settings(object):
                 'Exec': f'envlauncher --activate {activate} --directory {directory}',
             }
             venv_identifiers.append(identifier)
+        self._venv_identifiers = set(venv_identifiers)
 
         # Get current identifiers and remove old venv identifiers.
         actions_value = self._parser.get('Desktop Entry', 'Actions', fallback='')
         identifiers = actions_value.rstrip(';').split(';')
-        func = lambda x: x and not x.startswith(self._venv_prefix)
-        other_identifiers = [x for x in identifiers if func(x)]
+        venv_prefix = self._venv_prefix
+        other_identifiers = [
+            x for x in identifiers if x and not x.startswith(venv_prefix)
+        ]
 
         # Update the Desktop Entry group's Actions value.
         actions_value = ';'.join(venv_identifiers + other_identifiers)
@@ -343,47 +581,48 @@ class EnvLauncherApp(object):
         desktop_path = self.paths.find_resource_path('applications', f'{APP_NAME}.desktop')
         self.settings = Settings(desktop_path)
 
-    def _build_rcfile(self, environment, working_dir, file_to_delete) -> str:
-        """Build and return rcfile text to use when launching bash."""
-        rcfile_lines = []
+    def _build_rcfile(self, environment, working_dir, file_to_delete, out) -> None:
+        """Build rcfile text to use when launching bash and write it
+        to the file object *out*.
+        """
+        import shlex
 
         # First, change directory so relative paths reference new location.
-        rcfile_lines.append(f'cd {working_dir}')
+        out.write(f'cd {working_dir}\n')
 
         # Execute user rcfile (~/.bashrc or other).
-        if self.settings.rcfile:
-            rcfile_lines.append(f'source {self.settings.rcfile}')
+        user_rcfile = self.settings.rcfile
+        if user_rcfile:
+            out.write(f'source {user_rcfile}\n')
 
         # Add line to activate the environment!
-        rcfile_lines.append(f'source {environment}')
+        out.write(f'source {environment}\n')
 
         # Display the ASCII banner.
-        if self.settings.banner_resource:
-            subdir, filename = self.settings.banner_resource
+        banner_resource = self.settings.banner_resource
+        if banner_resource:
+            subdir, filename = banner_resource
             banner_path = self.paths.find_resource_path(subdir, filename)
-            rcfile_lines.append(f'cat {banner_path}')
+            out.write(f'cat {banner_path}\n')
 
         # The *file_to_delete* should be the name of the rcfile itself.
         # This way, it will remove itself when executed and we won't
         # need to wait before cleaning it up later.
-        rcfile_lines.append(f'rm {shlex.quote(file_to_delete)}')
-
-        # Blank entry to assure trailing "\n".
-        rcfile_lines.append('')
-
-        return '\n'.join(rcfile_lines)
+        out.write(f'rm {shlex.quote(file_to_delete)}\n')
 
     def __call__(self, environment, working_dir=None):
         """Launch a terminal emulator and activate a dev environment."""
+        import tempfile
+
         try:
             # Build the launcher script and write it to a tempfile. The last
             # line of the launcher script will remove the *file_to_delete*
             # which should be the name of the script itself.
             with tempfile.NamedTemporaryFile(mode='w', delete=False) as rcfile:
-                rcfile_text = self._build_rcfile(environment,
-                                                 working_dir,
-                                                 file_to_delete=rcfile.name)
-                rcfile.write(rcfile_text)
+                self._build_rcfile(environment,
+                                   working_dir,
+                                   file_to_delete=rcfile.name,
+                                   out=rcfile)
 
             # Instantiate the launcher, passing it the tempfile name.
             launcher = self.settings.launcher_class
@@ -403,11 +642,16 @@ class EnvLauncherApp(object):
 
 def configure_envlauncher(paths, reset_all=False):
     """Configure EnvLauncher settings."""
+    import shutil
+    import subprocess
+
     # Temporarily use shutil.copy() to prevent users from directly
     # opening a file they don't have write permissions for (e.g.
     # a file in "/usr/local/share/applications/...").
     desktop_home = paths.make_home_path('applications', f'{APP_NAME}.desktop')
-    if not os.path.exists(desktop_home):
+    try:
+        os.stat(desktop_home)
+    except FileNotFoundError:
         desktop_path = paths.find_resource_path('applications', f'{APP_NAME}.desktop')
         os.makedirs(os.path.dirname(desktop_home), exist_ok=True)
         shutil.copy(src=desktop_path, dst=desktop_home)
@@ -17,11 +17,17 @@
 
 """Command-line interface for EnvLauncher."""
 
-import argparse
+import functools
+import sys
+import types
+from typing import List, Optional
 
 
-def parse_args(args=None):
-    """Parse command line arguments."""
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the argument parser (constructed once and reused)."""
+    import argparse
+
     usage = (
         '\n'
         '  %(prog)s [-h]\n'
@@ -55,6 +61,47 @@ def parse_args(args=None):
         action='store_true',
         help='display EnvLauncher version and exit',
     )
+    return parser
+
+
+def _parse_activate_args(args: List[str]) -> Optional[types.SimpleNamespace]:
+    """Return parsed arguments for the common "--activate SCRIPT
+    [--directory PATH]" form (as used in desktop entry Exec keys)
+    without building an ArgumentParser. Returns None if *args* has
+    any other form so that argparse can handle it.
+    """
+    if len(args) == 2:
+        flag, activate = args
+        directory = None
+    elif len(args) == 4 and args[2] == '--directory':
+        flag, activate, _, directory = args
+        if directory.startswith('-'):
+            return None  # <- EXIT!
+    else:
+        return None  # <- EXIT!
+
+    if flag != '--activate' or not activate or activate.startswith('-'):
+        return None  # <- EXIT!
+
+    return types.SimpleNamespace(
+        activate=activate,
+        directory=directory,
+        configure=False,
+        reset_all=False,
+        version=False,
+    )
+
+
+def parse_args(args=None):
+    """Parse command line arguments."""
+    if args is None:
+        args = sys.argv[1:]
+
+    fast_args = _parse_activate_args(args)
+    if fast_args is not None:
+        return fast_args  # <- EXIT!
+
+    parser = _build_parser()
     args = parser.parse_args(args=args)
 
     # Check that arguments conform to `usage` examples.
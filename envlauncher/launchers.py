@@ -28,6 +28,9 @@ from time import sleep, time
 from typing import List, Optional
 
 
+_UNSET = object()  # Sentinel for values that have not been computed.
+
+
 def get_class_name(command: str) -> str:
     """Takes a terminal emulator command and returns the name of
     its launcher class as a string.
@@ -93,6 +96,8 @@ class GnomeTerminalLauncher(BaseLauncher):
     desktop environment.
     """
     command = 'gnome-terminal'
+    _server_path = _UNSET  #: Cached gnome-terminal-server location.
+    _session_bus = _UNSET  #: Cached jeepney connection (if available).
 
     def __init__(self, script_path):
         self.args = [
@@ -100,22 +105,71 @@ class GnomeTerminalLauncher(BaseLauncher):
             '--', 'bash', '--rcfile', script_path,
         ]
 
-    @staticmethod
-    def _find_gnome_terminal_server() -> Optional[str]:
-        """Find and return the path to gnome-terminal-server."""
+    @classmethod
+    def _find_gnome_terminal_server(cls) -> Optional[str]:
+        """Find and return the path to gnome-terminal-server.
+
+        The result is cached on the class since the server's location
+        does not change while the application is running.
+        """
+        if cls._server_path is not _UNSET:
+            return cls._server_path  # <- EXIT!
+
         search_paths = [
             '/usr/libexec/gnome-terminal-server',
             '/usr/lib/gnome-terminal/gnome-terminal-server',
             '/usr/lib/gnome-terminal-server',
         ]
+        found = None
         for path in search_paths:
-            if os.path.exists(path):
-                return path
-        return None
+            try:
+                os.stat(path)
+            except OSError:
+                continue
+            found = path
+            break
+        cls._server_path = found
+        return found
+
+    @classmethod
+    def _get_session_bus(cls):
+        """Return a jeepney connection to the session bus or None if
+        jeepney is not installed or the bus cannot be reached. The
+        connection is opened once and cached on the class.
+        """
+        if cls._session_bus is _UNSET:
+            try:
+                from jeepney.io.blocking import open_dbus_connection
+                cls._session_bus = open_dbus_connection(bus='SESSION')
+            except Exception:  # <- ImportError, OSError, KeyError, etc.
+                cls._session_bus = None
+        return cls._session_bus
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget the cached server location and close the cached
+        session bus connection (if any).
+        """
+        if cls._session_bus not in (_UNSET, None):
+            cls._session_bus.close()
+        cls._session_bus = _UNSET
+        cls._server_path = _UNSET
+
+    @classmethod
+    def name_has_owner(cls, name) -> bool:
+        """Check if the name exists on the session bus (has an owner).
+
+        If the optional "jeepney" package is installed, the method
+        call is made in-process. Otherwise, `dbus-send` is used.
+        """
+        bus = cls._get_session_bus()
+        if bus is not None:
+            from jeepney.bus_messages import message_bus
+            from jeepney.wrappers import unwrap_msg
+            message = message_bus.NameHasOwner(name)
+            reply = bus.send_and_get_reply(message, timeout=5)
+            return bool(unwrap_msg(reply)[0])  # <- EXIT! (raises on error reply)
 
-    @staticmethod
-    def name_has_owner(name) -> bool:
-        """Check if the name exists on the session bus (has an owner)."""
         reply = subprocess.check_output([
             'dbus-send',
             '--session',                          # <- use session message bus
@@ -148,11 +202,15 @@ class GnomeTerminalLauncher(BaseLauncher):
                 message=f'subprocess {process.pid} is still running',
             )
 
+            # The polling interval doubles after each check (1 ms, 2 ms,
+            # 4 ms, ... up to 1/8th of a second).
             timeout = time() + 1
+            interval = 0.001
             while True:
-                sleep(0.03125)  # 1/32nd of a second polling interval
+                sleep(interval)
                 if cls.name_has_owner(app_id):
                     return  # <- EXIT! (successfully registered)
+                interval = min(interval * 2, 0.125)
                 if time() > timeout:    # Timeout check must not be used in
                     raise TimeoutError  # the `while` condition--body of loop
         raise OSError                   # MUST execute at least once.
@@ -17,14 +17,19 @@
 
 """Main function for EnvLauncher."""
 
+import sys
 from .app import __version__
 from .app import DataPaths
 from .app import EnvLauncherApp
 from .app import configure_envlauncher
-from .cli import parse_args
 
 
 def main():
+    if sys.argv[1:] == ['--version']:  # <- Fast path, skips argparse.
+        print(__version__)
+        return  # <- EXIT!
+
+    from .cli import parse_args
     args = parse_args()
     if args.activate:
         launcher = EnvLauncherApp()
@@ -17,11 +17,15 @@
 
 """Tests for EnvLauncher."""
 
+import io
 import os
+import shlex
 import shutil
 import tempfile
 import textwrap
+import threading
 import unittest
+from unittest import mock
 import envlauncher
 
 
@@ -53,6 +57,36 @@ class TestDataPathsAttributes(unittest.TestCase):
         self.assertEqual(datapaths.data_dirs, ['/usr/local/share', '/usr/share'])
 
 
+class TestDataPathsDefaults(unittest.TestCase):
+    """DataPaths built from os.environ reuse previously computed paths."""
+    def setUp(self):
+        original = {k: os.environ.get(k) for k in ('XDG_DATA_HOME', 'XDG_DATA_DIRS')}
+
+        def restore():
+            for key, value in original.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+        self.addCleanup(restore)
+
+        os.environ['XDG_DATA_HOME'] = '/first/share'
+        os.environ['XDG_DATA_DIRS'] = '/foo/bar:/var/lib/baz'
+
+    def test_data_dirs_not_shared(self):
+        envlauncher.DataPaths().data_dirs.append('/evil')
+        self.assertEqual(envlauncher.DataPaths().data_dirs, ['/foo/bar', '/var/lib/baz'])
+
+    def test_environment_change(self):
+        self.assertEqual(envlauncher.DataPaths().data_home, '/first/share')
+
+        os.environ['XDG_DATA_HOME'] = '/second/share'
+        os.environ['XDG_DATA_DIRS'] = '/other/dir'
+        datapaths = envlauncher.DataPaths()
+        self.assertEqual(datapaths.data_home, '/second/share')
+        self.assertEqual(datapaths.data_dirs, ['/other/dir'])
+
+
 class DataPathsFindResourcePath(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -114,6 +148,65 @@ class DataPathsFindResourcePath(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             self.datapaths.find_resource_path('applications', 'app4.desktop')
 
+    def test_modified_data_dirs(self):
+        """Directories added to data_dirs should be searched."""
+        tempname = self.tempdir.name
+        datapaths = envlauncher.DataPaths({
+            'XDG_DATA_HOME': os.path.join(tempname, 'highest/preference'),
+            'XDG_DATA_DIRS': os.path.join(tempname, 'middle/preference'),
+        })
+        with self.assertRaises(FileNotFoundError):
+            datapaths.find_resource_path('applications', 'app3.desktop')
+
+        datapaths.data_dirs.append(os.path.join(tempname, 'lowest/preference'))
+        filepath = datapaths.find_resource_path('applications', 'app3.desktop')
+        regex = r'/lowest/preference/applications/app3[.]desktop$'
+        self.assertRegex(filepath, regex)
+
+
+class DataPathsResourceCache(unittest.TestCase):
+    def setUp(self):
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+
+        self.app_dir = os.path.join(tempdir.name, 'applications')
+        os.makedirs(self.app_dir)
+        self.filepath = os.path.join(self.app_dir, 'app1.desktop')
+        with open(self.filepath, 'w') as fh:
+            fh.write('dummy file contents')
+
+        self.datapaths = envlauncher.DataPaths({
+            'XDG_DATA_HOME': tempdir.name,
+            'XDG_DATA_DIRS': os.path.join(tempdir.name, 'missing'),
+        })
+
+    def test_cached_result(self):
+        """Once found, a resource path should be returned from cache."""
+        first = self.datapaths.find_resource_path('applications', 'app1.desktop')
+        os.remove(self.filepath)
+        second = self.datapaths.find_resource_path('applications', 'app1.desktop')
+        self.assertEqual(first, second)
+
+    def test_cached_listing(self):
+        """Directory listings should be reused for other filenames."""
+        self.datapaths.find_resource_path('applications', 'app1.desktop')
+        with open(os.path.join(self.app_dir, 'app2.desktop'), 'w') as fh:
+            fh.write('dummy file contents')
+        with self.assertRaises(FileNotFoundError):
+            self.datapaths.find_resource_path('applications', 'app2.desktop')
+
+        self.datapaths.invalidate()
+        filepath = self.datapaths.find_resource_path('applications', 'app2.desktop')
+        self.assertTrue(filepath.endswith('app2.desktop'))
+
+    def test_invalidate(self):
+        """After invalidate(), the file system should be searched again."""
+        self.datapaths.find_resource_path('applications', 'app1.desktop')
+        os.remove(self.filepath)
+        self.datapaths.invalidate()
+        with self.assertRaises(FileNotFoundError):
+            self.datapaths.find_resource_path('applications', 'app1.desktop')
+
 
 class DataPathsMakeHomePath(unittest.TestCase):
     def test_home_filepath(self):
@@ -125,64 +218,177 @@ class DataPathsMakeHomePath(unittest.TestCase):
         self.assertEqual(filepath, expected)
 
 
-class TestSettingsEscaping(unittest.TestCase):
-    """Since ConfigParser discards comments and extra empty lines,
-    we need to escape these lines so we can preserve them when
-    saving the config file.
+class TestFindAvailableCommands(unittest.TestCase):
+    def setUp(self):
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.bin_dir = tempdir.name
+
+        for name, mode in [('app1', 0o755), ('app2', 0o755), ('app3', 0o644)]:
+            filepath = os.path.join(self.bin_dir, name)
+            with open(filepath, 'w') as fh:
+                fh.write('#!/bin/sh\n')
+            os.chmod(filepath, mode)
+        os.mkdir(os.path.join(self.bin_dir, 'app4'))  # <- Directory, not a file.
+
+    def test_available(self):
+        path = os.pathsep.join([self.bin_dir, '/nonexistent/directory'])
+        commands = ['app1', 'app3', 'app4', 'app5']
+        found = envlauncher.find_available_commands(commands, path)
+        self.assertEqual(found, {'app1'}, msg='only executable files that were asked for')
+
+
+class TestSplitCommandLine(unittest.TestCase):
+    def test_matches_shlex(self):
+        values = [
+            '',
+            'envlauncher --activate /home/user/venv/bin/activate --directory /home/user',
+            '  extra   spaces  ',
+            "envlauncher --activate '/path with/spaces' --directory \"quoted dir\"",
+            'tab\tseparated',
+            'back\\slash',
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(envlauncher.split_command_line(value), shlex.split(value))
+
 
-    From the XDG Desktop Entry Specification (version 1.5):
+class TestDesktopEntryParser(unittest.TestCase):
+    """From the XDG Desktop Entry Specification (version 1.5):
 
       "Lines beginning with a # and blank lines are considered
       comments and will be ignored, however they should be
       preserved across reads and writes of the desktop entry
       file."
     """
+    @staticmethod
+    def roundtrip(string):  # <- Helper method.
+        parser = envlauncher.DesktopEntryParser()
+        parser.read_string(string)
+        f = io.StringIO()
+        parser.write(f)
+        return f.getvalue()
 
-    def setUp(self):
-        prefix = envlauncher.Settings._escape_prefix
-        suffix = envlauncher.Settings._escape_suffix
+    def test_preserve_comments_and_blank_lines(self):
+        string = textwrap.dedent("""
+            #Leading comment
 
-        self.unescaped = textwrap.dedent("""
             [Desktop Entry]
             Type=Application
 
 
             Exec=gnome-terminal
             #Keywords=hello;world; <- A COMMENT!
-        """).lstrip()
+            #[Desktop Action old]
 
-        self.escaped = textwrap.dedent(f"""
-            [Desktop Entry]
-            Type=Application
-            {prefix}3{suffix}
-            {prefix}4{suffix}
-            Exec=gnome-terminal
-            {prefix}6{suffix}#Keywords=hello;world; <- A COMMENT!
+            [Desktop Action other]
+            Name=Other
         """).lstrip()
+        self.assertEqual(self.roundtrip(string), string + '\n')
 
-    def test_prefix_and_suffix(self):
-        prefix = envlauncher.Settings._escape_prefix
-        suffix = envlauncher.Settings._escape_suffix
-
-        self.assertNotIn(suffix, prefix, msg='Suffix must not be a substring of prefix.')
-        self.assertEqual(suffix.count('='), 1, msg='Must contain one equals sign.')
-        self.assertNotEqual(suffix[0], '=', msg='Equals sign must not be first character.')
-        self.assertNotEqual(suffix[-1], '=', msg='Equals sign must not be last character.')
-
-    def test_escape_comments(self):
-        """Should escape comments and blank lines."""
-        escaped = envlauncher.Settings._escape_comments(self.unescaped)
-        self.assertEqual(escaped, self.escaped)
+    def test_blank_lines_before_header(self):
+        """The last blank line before a group header is replaced by
+        the blank line that is written between groups.
+        """
+        string = '[A]\nfoo=1\n\n\n[B]\n[C]\nbar=2\n'
+        expected = '[A]\nfoo=1\n\n\n[B]\n\n[C]\nbar=2\n\n'
+        self.assertEqual(self.roundtrip(string), expected)
 
-    def test_unescape_comments(self):
-        """Should escape comments and blank lines."""
-        unescaped = envlauncher.Settings._unescape_comments(self.escaped)
-        self.assertEqual(unescaped, self.unescaped)
+    def test_keys_and_values(self):
+        parser = envlauncher.DesktopEntryParser()
+        parser.read_string(textwrap.dedent("""
+            [Desktop Entry]
+            Name=EnvLauncher
+            name = lowercase key
+            Exec=envlauncher %U
+        """))
+        group = parser['Desktop Entry']
+        self.assertEqual(group['Name'], 'EnvLauncher')
+        self.assertEqual(group['name'], 'lowercase key', msg='keys are case-sensitive')
+        self.assertEqual(group['Exec'], 'envlauncher %U', msg='no interpolation')
+        self.assertEqual(parser.get('Desktop Entry', 'Missing', fallback=''), '')
+        self.assertEqual(parser.get('Missing Group', 'Name', fallback=''), '')
+
+    def test_modify_groups(self):
+        parser = envlauncher.DesktopEntryParser()
+        parser.read_string('[A]\nfoo=1\n#comment\n\n[B]\nbar=2\n')
+
+        parser['A']['baz'] = '3'
+        del parser['A']['foo']
+        parser['C'] = {'qux': '4'}
+        del parser['B']
+
+        self.assertEqual(parser.sections(), ['A', 'C'])
+        f = io.StringIO()
+        parser.write(f)
+        self.assertEqual(f.getvalue(), '[A]\n#comment\nbaz=3\n\n[C]\nqux=4\n\n')
+
+    def test_key_before_group(self):
+        parser = envlauncher.DesktopEntryParser()
+        with self.assertRaises(ValueError):
+            parser.read_string('Name=EnvLauncher\n[Desktop Entry]\n')
+
+    def test_read_file(self):
+        string = '#Leading comment\n\n[A]\nfoo=1\n\n#comment\n\n\n[B]\nbar=2\n'
+
+        from_string = envlauncher.DesktopEntryParser()
+        from_string.read_string(string)
+        expected = io.StringIO()
+        from_string.write(expected)
+
+        from_file = envlauncher.DesktopEntryParser()
+        from_file.read_file(io.StringIO(string))
+        actual = io.StringIO()
+        from_file.write(actual)
+
+        self.assertEqual(actual.getvalue(), expected.getvalue())
+
+
+class TestSettingsFileSize(unittest.TestCase):
+    def test_file_path(self):
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as fh:
+            fh.write('[Desktop Entry]\n')
+            fh.write('#' * (128 * 1024))
+        self.addCleanup(lambda: os.remove(fh.name))
+
+        with self.assertRaises(RuntimeError):
+            envlauncher.Settings(fh.name)
+
+    def test_file_like_object(self):
+        string = '[Desktop Entry]\n' + ('#' * (128 * 1024))
+        with self.assertRaises(RuntimeError):
+            envlauncher.Settings.from_string(string)
 
-    def test_roundtrip(self):
-        escaped = envlauncher.Settings._escape_comments(self.unescaped)
-        unescaped = envlauncher.Settings._unescape_comments(escaped)
-        self.assertEqual(unescaped, self.unescaped)
+    @staticmethod
+    def open_pipe(data):  # <- Helper method.
+        """Return a file object reading *data* from an os.pipe()."""
+        read_fd, write_fd = os.pipe()
+
+        def write_data():
+            try:
+                with open(write_fd, 'w') as fh:
+                    fh.write(data)
+            except BrokenPipeError:  # <- Reader closed before all data was read.
+                pass
+
+        writer = threading.Thread(target=write_data)
+        writer.start()
+        return open(read_fd), writer
+
+    def test_pipe(self):
+        """A pipe's fstat() size is 0, so it must not bypass the limit."""
+        f, writer = self.open_pipe('[Desktop Entry]\n' + ('#' * (200 * 1024)))
+        with f:
+            with self.assertRaises(RuntimeError):
+                envlauncher.Settings(f)
+        writer.join()
+
+    def test_pipe_within_limit(self):
+        f, writer = self.open_pipe('[Desktop Entry]\nName=EnvLauncher\n')
+        with f:
+            settings = envlauncher.Settings(f)
+        writer.join()
+        self.assertEqual(settings.export_string(), '[Desktop Entry]\nName=EnvLauncher\n')
 
 
 class TestSettingsFormatting(unittest.TestCase):
@@ -238,6 +444,12 @@ class TestSettingsFormatting(unittest.TestCase):
         export = parser.export_string()
         self.assertEqual(export, desktop_entry)
 
+    def test_crlf_line_endings(self):
+        """Carriage returns should not be kept in comment lines."""
+        parser = envlauncher.Settings.from_string('[A]\r\n#c\r\nKey=v\r\n')
+        export = parser.export_string()
+        self.assertEqual(export, '[A]\n#c\nKey=v\n')
+
 
 class TestSettingsRcfile(unittest.TestCase):
     def setUp(self):
@@ -296,6 +508,26 @@ class TestSettingsTerminalEmulator(unittest.TestCase):
         self.assertIn(value_from_getter, available_commands,
                       msg='should default to an available terminal emulator')
 
+    def test_available_launchers_cached(self):
+        """The PATH scan should be reused and callers should get their
+        own copy of the result.
+        """
+        find_launchers = envlauncher.app._find_available_launchers
+        find_launchers.cache_clear()
+        self.addCleanup(find_launchers.cache_clear)
+
+        real_find = envlauncher.app.find_available_commands
+        with mock.patch.object(envlauncher.app, 'find_available_commands',
+                               wraps=real_find) as find_commands:
+            first = envlauncher.app.get_available_launchers()
+            expected = list(first)
+            first.clear()
+            for _ in range(3):
+                self.assertEqual(envlauncher.app.get_available_launchers(), expected)
+                self.settings.launcher_class
+
+        self.assertEqual(find_commands.call_count, 1, msg='PATH should be scanned once')
+
 
 class TestSettingsBanner(unittest.TestCase):
     def setUp(self):
@@ -366,6 +598,22 @@ class TestSettingsMakeIdentifier(unittest.TestCase):
                          msg='skips 2 since "venv2" already exists')
         self.assertEqual(settings.make_identifier(), f'{prefix}4')
 
+    def test_after_set_actions(self):
+        """Identifiers removed by set_actions() should be available again."""
+        prefix = envlauncher.Settings._venv_prefix
+        desktop_entry = textwrap.dedent(f"""
+            [Desktop Entry]
+            Name=EnvLauncher
+            Exec=envlauncher --configure
+            Type=Application
+            Actions={prefix}1;{prefix}3;configure;
+        """)
+        settings = envlauncher.Settings.from_string(desktop_entry)
+        settings.set_actions([(f'{prefix}2', 'Two', '/path/to/activate', '/path/to/dir')])
+        self.assertEqual(settings.make_identifier(), f'{prefix}1')
+        self.assertEqual(settings.make_identifier(), f'{prefix}3',
+                         msg='skips 2 since "venv2" already exists')
+
 
 class TestSettingsGetActions(unittest.TestCase):
     def setUp(self):
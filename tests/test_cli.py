@@ -49,6 +49,30 @@ class TestParseArgs(unittest.TestCase):
         self.assertEqual(args.configure, False)
         self.assertEqual(args.reset_all, False)
 
+    def test_activate_argparse_forms(self):
+        """Forms not handled by the fast path must still be parsed."""
+        args = parse_args(['--activate=myscript', '--directory=mydir'])
+        self.assertEqual(args.activate, 'myscript')
+        self.assertEqual(args.directory, 'mydir')
+
+        args = parse_args(['--directory', 'mydir', '--activate', 'myscript'])
+        self.assertEqual(args.activate, 'myscript')
+        self.assertEqual(args.directory, 'mydir')
+
+    def test_activate_empty_with_directory(self):
+        """An empty --activate value must not bypass validation."""
+        with self.assertRaises(SystemExit):
+            args = parse_args(['--activate', '', '--directory', '/d'])
+
+        self.assertIn(
+            'argument --activate is required when using --directory',
+            self.exit_message.getvalue(),
+        )
+
+    def test_activate_missing_value(self):
+        with self.assertRaises(SystemExit):
+            args = parse_args(['--activate', '--directory'])
+
     def test_directory(self):
         with self.assertRaises(SystemExit):
             args = parse_args(['--directory', 'mydir'])
@@ -15,12 +15,14 @@
 # You should have received a copy of the GNU General Public License
 # along with EnvLauncher.  If not, see <https://www.gnu.org/licenses/>.
 
+import importlib.util
 import os
 import shutil
 import subprocess
 import tempfile
 import time
 import unittest
+from unittest import mock
 from envlauncher import launchers
 
 
@@ -131,6 +133,65 @@ class TestGnomeTerminalHelperMethods(unittest.TestCase):
         self.assertTrue(result)
 
 
+class TestGnomeTerminalNameHasOwner(unittest.TestCase):
+    """Check name_has_owner() without a live session bus."""
+    def setUp(self):
+        launchers.GnomeTerminalLauncher.clear_cache()
+        self.addCleanup(launchers.GnomeTerminalLauncher.clear_cache)
+
+    @staticmethod
+    def make_fake_bus(make_reply):  # <- Helper method.
+        """Return a fake bus whose replies are built by *make_reply*."""
+        bus = mock.Mock()
+        bus.send_and_get_reply.side_effect = lambda msg, timeout: make_reply(msg)
+        return bus
+
+    @unittest.skipUnless(importlib.util.find_spec('jeepney'), 'requires jeepney')
+    def test_jeepney_reply(self):
+        from jeepney import new_method_return
+
+        for value in [True, False]:
+            with self.subTest(value=value):
+                bus = self.make_fake_bus(
+                    lambda msg: new_method_return(msg, 'b', (value,))
+                )
+                with mock.patch.object(launchers.GnomeTerminalLauncher,
+                                       '_get_session_bus', return_value=bus):
+                    result = launchers.GnomeTerminalLauncher.name_has_owner('a.b.c')
+                self.assertIs(result, value)
+
+                message = bus.send_and_get_reply.call_args[0][0]
+                self.assertEqual(message.body, ('a.b.c',))
+
+    @unittest.skipUnless(importlib.util.find_spec('jeepney'), 'requires jeepney')
+    def test_jeepney_error_reply(self):
+        """An error reply must raise rather than count as an owner."""
+        from jeepney import new_error
+        from jeepney.wrappers import DBusErrorResponse
+
+        bus = self.make_fake_bus(lambda msg: new_error(
+            msg, 'org.freedesktop.DBus.Error.Failed', 's', ('failure text',)
+        ))
+        with mock.patch.object(launchers.GnomeTerminalLauncher,
+                               '_get_session_bus', return_value=bus):
+            with self.assertRaises(DBusErrorResponse):
+                launchers.GnomeTerminalLauncher.name_has_owner('a.b.c')
+
+    def test_dbus_send_fallback(self):
+        """Without a jeepney connection, `dbus-send` should be used."""
+        launchers.GnomeTerminalLauncher._session_bus = None
+        for reply, expected in [(b'   boolean true\n', True),
+                                (b'   boolean false\n', False)]:
+            with self.subTest(reply=reply):
+                with mock.patch.object(launchers.subprocess, 'check_output',
+                                       return_value=reply) as check_output:
+                    result = launchers.GnomeTerminalLauncher.name_has_owner('a.b.c')
+                self.assertIs(result, expected)
+                args = check_output.call_args[0][0]
+                self.assertEqual(args[0], 'dbus-send')
+                self.assertEqual(args[-1], 'string:a.b.c')
+
+
 @requires_command('yakuake')
 class TestYakuakeHelperMethods(unittest.TestCase):
     def test_build_args_unqualified(self):